@@ -399,6 +399,14 @@ if has_native_dist_support:
         def _do_all_gather(self, tensor: torch.Tensor) -> torch.Tensor:
             if tensor.ndimension() == 0:
                 tensor = tensor.unsqueeze(0)
+            # `_all_gather_base` is deprecated in favor of public `all_gather_into_tensor` in newer pytorch
+            all_gather_into_tensor = getattr(dist, "all_gather_into_tensor", getattr(dist, "_all_gather_base", None))
+            if self.backend() == dist.Backend.NCCL and all_gather_into_tensor is not None:
+                # gather directly into a single flat buffer and avoid list allocation + concatenation
+                output_size = (self.get_world_size() * tensor.shape[0],) + tuple(tensor.shape[1:])
+                flat_output = torch.empty(output_size, dtype=tensor.dtype, device=tensor.device)
+                all_gather_into_tensor(flat_output, tensor.contiguous())
+                return flat_output
             output = [torch.zeros_like(tensor) for _ in range(self.get_world_size())]
             dist.all_gather(output, tensor)
             return torch.cat(output, dim=0)
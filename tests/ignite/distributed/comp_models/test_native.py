@@ -380,3 +380,28 @@ def test__native_dist_model_init_method_is_not_none(world_size, local_rank, get_
 
     with pytest.raises(ValueError, match=r"Both rank and world_size should be provided"):
         _NativeDistModel.create_from_backend(backend="gloo", rank=local_rank, init_method=init_method)
+
+
+def _test__native_dist_model_all_gather_vs_list(model, tensor):
+    res = model._do_all_gather(tensor)
+
+    if tensor.ndimension() == 0:
+        tensor = tensor.unsqueeze(0)
+    output = [torch.zeros_like(tensor) for _ in range(model.get_world_size())]
+    dist.all_gather(output, tensor)
+    true_res = torch.cat(output, dim=0)
+
+    assert res.shape == true_res.shape, f"{res.shape} vs {true_res.shape}"
+    assert res.dtype == true_res.dtype, f"{res.dtype} vs {true_res.dtype}"
+    assert (res == true_res).all()
+
+
+@pytest.mark.distributed
+@pytest.mark.skipif(torch.cuda.device_count() < 1, reason="Skip if no GPU")
+def test__native_dist_model_all_gather_nccl(distributed_context_single_node_nccl):
+    model = _NativeDistModel.create_from_context()
+    device = model.device()
+    rank = model.get_rank()
+
+    _test__native_dist_model_all_gather_vs_list(model, torch.tensor(rank, device=device))
+    _test__native_dist_model_all_gather_vs_list(model, torch.arange(100, device=device).reshape(4, 25) * (rank + 1))
@@ -1,3 +1,5 @@
+import math
+
 import pytest
 import torch
 import torch.distributed as dist
@@ -77,30 +79,34 @@ def _test_distrib_all_reduce(device):
     res = idist.all_reduce(10)
     assert res == 10 * idist.get_world_size()
 
-    t = torch.tensor(10, device=device)
-    res = idist.all_reduce(t)
-    assert res.item() == 10 * idist.get_world_size()
-
     rank = idist.get_rank()
-    t = torch.tensor(rank * 2.0 + 1.0, device=device)
+    ws = idist.get_world_size()
+
+    # pack the integer SUM operands into a single tensor to issue one collective
+    t = torch.tensor([10, rank * 2 + 1], device=device)
+    in_dtype = t.dtype
     res = idist.all_reduce(t)
-    assert res.item() == sum([i * 2.0 + 1.0 for i in range(idist.get_world_size())])
+    assert res.dtype == in_dtype
+    assert res[0].item() == 10 * ws
+    # sum of the first ws odd numbers
+    assert res[1].item() == float(ws * ws)
 
     t = torch.tensor(rank * 2.0 + 1.0, device=device)
-    res = idist.all_reduce(t, "MIN").item()
-    true_val = min([i * 2 + 1 for i in range(idist.get_world_size())])
+    res = idist.all_reduce(t.clone()).item()
+    true_val = float(ws * ws)
     assert res == true_val, f"{res} vs {true_val}"
 
-    t = torch.tensor(rank * 2.0 + 1.0, device=device)
-    res = idist.all_reduce(t, "MAX").item()
-    true_val = max([i * 2.0 + 1.0 for i in range(idist.get_world_size())])
+    res = idist.all_reduce(t.clone(), "MIN").item()
+    true_val = 1.0
     assert res == true_val, f"{res} vs {true_val}"
 
-    t = torch.tensor(rank * 2.0 + 1.0, device=device)
-    res = idist.all_reduce(t, "PRODUCT").item()
-    true_val = 1
-    for v in [i * 2.0 + 1.0 for i in range(idist.get_world_size())]:
-        true_val *= v
+    res = idist.all_reduce(t.clone(), "MAX").item()
+    true_val = 2.0 * ws - 1.0
+    assert res == true_val, f"{res} vs {true_val}"
+
+    res = idist.all_reduce(t.clone(), "PRODUCT").item()
+    # double factorial (2 * ws - 1)!! = (2 * ws)! / (2 ** ws * ws!)
+    true_val = math.factorial(2 * ws) // (2 ** ws * math.factorial(ws))
     assert res == true_val, f"{res} vs {true_val}"
 
     if idist.get_world_size() > 1:
@@ -161,6 +167,15 @@ def _test_distrib_broadcast(device):
 
     rank = idist.get_rank()
     ws = idist.get_world_size()
+
+    # allocate broadcast buffers and expected values once and refill them for every src
+    true_res_f = torch.tensor([1.2345, 2.3456], dtype=torch.float, device=device)
+    base_l = torch.arange(100, device=device).reshape(4, 25)
+    true_res_l = torch.empty_like(base_l)
+    t_f = torch.empty(2, dtype=torch.float, device=device)
+    t_l = torch.empty(4, 25, dtype=torch.long, device=device)
+    long_text = "tests/ignite/distributed/utils/test_horovod.py::test_idist_broadcast_hvd" * 200
+
     for src in range(ws):
 
         d = 10 if rank == src else 0
@@ -169,13 +184,25 @@ def _test_distrib_broadcast(device):
         assert res == true_res
 
         if rank == src:
-            t = torch.tensor([1.2345, 2.3456], dtype=torch.float, device=device)
+            t_f.copy_(true_res_f)
         else:
-            t = torch.empty(2, device=device)
+            # reset the buffer to make sure the data is received from src on every iteration
+            t_f.fill_(float("nan"))
 
-        res = idist.broadcast(t, src=src)
-        true_res = torch.tensor([1.2345, 2.3456], dtype=torch.float, device=device)
-        assert (res == true_res).all(), f"{res} vs {true_res}"
+        res = idist.broadcast(t_f, src=src)
+        assert (res == true_res_f).all(), f"{res} vs {true_res_f}"
+
+        torch.mul(base_l, src + 1, out=true_res_l)
+        if rank == src:
+            t_l.copy_(true_res_l)
+        else:
+            t_l.fill_(-1)
+
+        in_dtype = torch.long
+        res = idist.broadcast(t_l, src)
+        assert res.shape == (4, 25)
+        assert res.dtype == in_dtype
+        assert (res == true_res_l).all()
 
         def _test(text):
 
@@ -189,19 +216,7 @@ def _test_distrib_broadcast(device):
             assert res == true_res
 
         _test("test-abcdefg")
-        _test("tests/ignite/distributed/utils/test_horovod.py::test_idist_broadcast_hvd" * 200)
-
-        if rank == src:
-            t = torch.arange(100, device=device).reshape(4, 25) * (src + 1)
-        else:
-            t = torch.empty(4, 25, dtype=torch.long, device=device)
-
-        in_dtype = torch.long
-        res = idist.broadcast(t, src)
-        assert res.shape == (4, 25)
-        assert res.dtype == in_dtype
-        true_res = torch.arange(100, device=device).reshape(4, 25) * (src + 1)
-        assert (res == true_res).all()
+        _test(long_text)
 
     if idist.get_world_size() > 1:
         with pytest.raises(TypeError, match=r"Unhandled input type"):
@@ -215,22 +230,25 @@ def _test_distrib_barrier(device):
 
     if idist.get_rank() == 0:
         t += 10.0
-    idist.barrier()
 
+    # all_reduce is a synchronization point by itself, no explicit barrier is needed before it
     tt = idist.all_reduce(t)
     assert tt.item() == true_res + 10.0
 
+    # exercise barrier on its own, without chaining it with another collective
+    idist.barrier()
+
 
 def _test_distrib_one_rank_only(device):
     def _test(barrier):
         # last rank
         rank = idist.get_world_size() - 1
 
-        value = torch.tensor(0).to(device)
+        value = torch.zeros((), dtype=torch.long, device=device)
 
         @idist.one_rank_only(rank=rank, with_barrier=barrier)
         def initialize():
-            value.data = torch.tensor(100).to(device)
+            value.fill_(100)
 
         initialize()
 
@@ -250,12 +268,12 @@ def _test_distrib_one_rank_only_with_engine(device):
     def _test(barrier):
         engine = Engine(lambda e, b: b)
 
-        batch_sum = torch.tensor(0).to(device)
+        batch_sum = torch.zeros((), dtype=torch.long, device=device)
 
         @engine.on(Events.ITERATION_COMPLETED)
         @idist.one_rank_only(with_barrier=barrier)  # ie rank == 0
         def _(_):
-            batch_sum.data += torch.tensor(engine.state.batch).to(device)
+            batch_sum.add_(engine.state.batch)
 
         engine.run([1, 2, 3], max_epochs=2)
 